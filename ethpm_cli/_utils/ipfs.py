@@ -1,10 +1,13 @@
+import functools
 import json
+import os
 from pathlib import Path
 from typing import Tuple
 
 from eth_typing import URI
 from ethpm.backends.ipfs import BaseIPFSBackend, InfuraIPFSBackend, LocalIPFSBackend
-from ethpm.validation.manifest import validate_manifest_against_schema
+
+from ethpm_cli.validation import validate_manifest_against_schema
 
 
 def pin_local_manifest(manifest_path: Path) -> Tuple[str, str, URI]:
@@ -20,7 +23,29 @@ def pin_local_manifest(manifest_path: Path) -> Tuple[str, str, URI]:
     return (package_name, package_version, manifest_uri)
 
 
+def get_ipfs_fetch_workers() -> int:
+    """
+    Number of threads used to concurrently fetch assets from IPFS. Fetches are
+    network-bound, so more threads than cores are used, but the total is capped
+    to avoid flooding the IPFS node with requests.
+    """
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
 def get_ipfs_backend(ipfs: bool = False) -> BaseIPFSBackend:
+    return _get_ipfs_backend(ipfs)
+
+
+# Reuse backends so that their http connections are shared across all ipfs requests
+@functools.lru_cache(maxsize=4)
+def _get_ipfs_backend(ipfs: bool) -> BaseIPFSBackend:
     if ipfs:
         return LocalIPFSBackend()
     return InfuraIPFSBackend()
+
+
+# IPFS backends re-hash everything they fetch to verify it against its uri, so cache
+# contents that are shared between packages (i.e. diamond dependencies) by uri.
+@functools.lru_cache(maxsize=1024)
+def fetch_ipfs_contents(uri: URI, ipfs_backend: BaseIPFSBackend) -> bytes:
+    return ipfs_backend.fetch_uri_contents(uri)
@@ -0,0 +1,26 @@
+import functools
+
+from eth_typing import URI
+from ethpm.backends.http import (
+    is_valid_content_addressed_github_uri as _is_valid_content_addressed_github_uri,
+)
+from ethpm.backends.registry import is_valid_registry_uri as _is_valid_registry_uri
+from ethpm.uri import is_ipfs_uri as _is_ipfs_uri
+
+# Classifying a uri is a pure function of the uri, and the same uris get classified
+# repeatedly (e.g. shared build dependencies, source urls), so results are cached.
+
+
+@functools.lru_cache(maxsize=1024)
+def is_ipfs_uri(uri: str) -> bool:
+    return _is_ipfs_uri(uri)
+
+
+@functools.lru_cache(maxsize=1024)
+def is_valid_registry_uri(uri: str) -> bool:
+    return _is_valid_registry_uri(uri)
+
+
+@functools.lru_cache(maxsize=1024)
+def is_valid_content_addressed_github_uri(uri: URI) -> bool:
+    return _is_valid_content_addressed_github_uri(uri)
@@ -1,23 +1,28 @@
 from argparse import Namespace
+from concurrent.futures import as_completed
 import copy
 import json
 import logging
 from pathlib import Path
 import shutil
 import tempfile
-from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
 from eth_typing import URI
 from eth_utils import to_dict, to_int, to_text, to_tuple
 from eth_utils.toolz import assoc, dissoc
-from ethpm.backends.ipfs import BaseIPFSBackend
-from ethpm.backends.registry import is_valid_registry_uri, parse_registry_uri
-from ethpm.uri import is_ipfs_uri
+from ethpm.backends.registry import parse_registry_uri
 
-from ethpm_cli._utils.filesystem import atomic_replace, is_package_installed
+from ethpm_cli._utils.filesystem import (
+    atomic_replace,
+    is_package_installed,
+    write_bytes,
+)
+from ethpm_cli._utils.ipfs import fetch_ipfs_contents
 from ethpm_cli._utils.logger import cli_logger
 from ethpm_cli._utils.shellart import bold_blue, bold_green, bold_white
-from ethpm_cli.commands.package import InstalledPackage, Package
+from ethpm_cli._utils.uri import is_ipfs_uri, is_valid_registry_uri
+from ethpm_cli.commands.package import InstalledPackage, Package, prefetch_manifests
 from ethpm_cli.commands.registry import get_active_registry
 from ethpm_cli.config import Config
 from ethpm_cli.constants import (
@@ -33,22 +38,25 @@ logger = logging.getLogger("ethpm_cli.install")
 
 
 def install_package(package: Package, config: Config) -> None:
-    if is_package_installed(package.alias, config):
+    dest_package_dir = config.ethpm_dir / package.alias
+    if dest_package_dir.exists():
         raise InstallError(
             f"Installation conflict: Package: '{package.manifest['name']}' "
             f"aliased to '{package.alias}' already installed on the filesystem at "
-            f"{config.ethpm_dir / package.alias}. Try installing this package with "
+            f"{dest_package_dir}. Try installing this package with "
             "a different alias."
         )
+    validate_parent_directory(config.ethpm_dir, dest_package_dir)
 
-    # Create temporary package directory
-    tmp_package_dir = Path(tempfile.mkdtemp())
-    write_package_installation_files(package, tmp_package_dir, config.ipfs_backend)
+    # Create temporary package directory on the same filesystem as the ethpm dir, but
+    # outside of it, so that it's never mistaken for an installed package
+    with tempfile.TemporaryDirectory(dir=config.ethpm_dir.parent) as tmpdir:
+        tmp_package_dir = Path(tmpdir) / package.alias
+        tmp_package_dir.mkdir()
+        write_package_installation_files(package, tmp_package_dir, config)
 
-    # Copy temp package directory to ethpm dir namespace
-    dest_package_dir = config.ethpm_dir / package.alias
-    validate_parent_directory(config.ethpm_dir, dest_package_dir)
-    shutil.copytree(tmp_package_dir, dest_package_dir)
+        # Move temp package directory into ethpm dir namespace
+        tmp_package_dir.replace(dest_package_dir)
     install_to_ethpm_lock(package, (config.ethpm_dir / LOCKFILE_NAME))
 
 
@@ -89,39 +97,45 @@ class InstalledPackageTree(NamedTuple):
 
 
 def list_installed_packages(config: Config) -> None:
-    installed_packages = [
-        get_installed_package_tree(base_dir)
-        for base_dir in config.ethpm_dir.iterdir()
-        if base_dir.is_dir()
-    ]
+    installed_packages = get_installed_package_trees(config.ethpm_dir)
     for package in sorted(installed_packages):
         logger.info(package.format_for_display)
 
 
-def get_installed_package_tree(base_dir: Path, depth: int = 0) -> InstalledPackageTree:
+@to_tuple
+def get_installed_package_trees(
+    ethpm_dir: Path, depth: int = 0
+) -> Iterable[InstalledPackageTree]:
+    package_dirs = get_package_dirs(ethpm_dir)
+    if not package_dirs:
+        return
+
+    # All packages in an ethpm dir share a lockfile, so it only needs to be read once
+    ethpm_lock = json.loads((ethpm_dir / LOCKFILE_NAME).read_text())
+    for package_dir in package_dirs:
+        yield get_installed_package_tree(package_dir, ethpm_lock, depth)
+
+
+def get_installed_package_tree(
+    base_dir: Path, ethpm_lock: Dict[str, Any], depth: int = 0
+) -> InstalledPackageTree:
     manifest = json.loads((base_dir / "manifest.json").read_text())
-    ethpm_lock = json.loads((base_dir.parent / LOCKFILE_NAME).read_text())
     content_hash = ethpm_lock[base_dir.name]["resolved_uri"]
-    dependency_dirs = get_dependency_dirs(base_dir)
-    children = tuple(
-        get_installed_package_tree(dependency_dir, depth + 1)
-        for dependency_dir in dependency_dirs
-    )
+    children = get_installed_package_trees(base_dir / ETHPM_PACKAGES_DIR, depth + 1)
     return InstalledPackageTree(depth, base_dir, manifest, children, content_hash)
 
 
 @to_tuple
-def get_dependency_dirs(base_dir: Path) -> Iterable[Path]:
-    dep_dir = base_dir / ETHPM_PACKAGES_DIR
-    if dep_dir.is_dir():
-        for ddir in dep_dir.iterdir():
+def get_package_dirs(ethpm_dir: Path) -> Iterable[Path]:
+    if ethpm_dir.is_dir():
+        for ddir in ethpm_dir.iterdir():
             if ddir.is_dir():
                 yield ddir
 
 
 @to_tuple
 def get_package_aliases(package_name: str, config: Config) -> Iterable[Tuple[str, ...]]:
-    lockfile_path = config.ethpm_dir / "ethpm.lock"
+    lockfile_path = config.ethpm_dir / LOCKFILE_NAME
     if lockfile_path.is_file():
         lockfile = json.loads(lockfile_path.read_text())
         all_aliases = [
@@ -136,7 +150,7 @@ def get_package_aliases(package_name: str, config: Config) -> Iterable[Tuple[str
 def resolve_installed_package_by_id(
     package_id: str, config: Config
 ) -> InstalledPackage:
-    lockfile_path = config.ethpm_dir / "ethpm.lock"
+    lockfile_path = config.ethpm_dir / LOCKFILE_NAME
     lockfile = json.loads(lockfile_path.read_text())
     return InstalledPackage(**lockfile[package_id])
 
@@ -218,8 +232,7 @@ def update_package(args: Namespace, config: Config) -> None:
     with tempfile.TemporaryDirectory() as tmpdir:
         tmp_ethpm_dir = Path(tmpdir) / ETHPM_PACKAGES_DIR
         shutil.copytree(config.ethpm_dir, tmp_ethpm_dir)
-        tmp_config = copy.copy(config)
-        tmp_config.ethpm_dir = tmp_ethpm_dir
+        tmp_config = config.copy_with_ethpm_dir(tmp_ethpm_dir)
         uninstall_package(args.package, tmp_config)
         install_package(updated_package, tmp_config)
         shutil.rmtree(config.ethpm_dir)
@@ -268,92 +281,138 @@ def check_for_aliased_package(package_name: str, config: Config) -> None:
 
 
 def write_package_installation_files(
-    package: Package, tmp_package_dir: Path, ipfs_backend: BaseIPFSBackend
-) -> None:
-    (tmp_package_dir / "manifest.json").touch()
-    (tmp_package_dir / "manifest.json").write_bytes(package.raw_manifest)
-
-    write_sources_to_disk(package, tmp_package_dir, ipfs_backend)
-    write_docs_to_disk(package, tmp_package_dir, ipfs_backend)
-    write_build_deps_to_disk(package, tmp_package_dir, ipfs_backend)
-    tmp_ethpm_lock = tmp_package_dir.parent / LOCKFILE_NAME
-    install_to_ethpm_lock(package, tmp_ethpm_lock)
-
-
-def write_sources_to_disk(
-    package: Package, package_dir: Path, ipfs_backend: BaseIPFSBackend
+    package: Package, tmp_package_dir: Path, config: Config
 ) -> None:
+    # Walk the dependency tree one level at a time rather than recursively, so
+    # that all of the dependency manifests in a level are fetched concurrently.
+    level = [(package, tmp_package_dir)]
+    while level:
+        for level_package, package_dir in level:
+            write_bytes(package_dir / "manifest.json", level_package.raw_manifest)
+            write_sources_to_disk(level_package, package_dir, config)
+            write_docs_to_disk(level_package, package_dir, config)
+        level = write_build_deps_to_disk(level, config)
+
+
+def write_sources_to_disk(package: Package, package_dir: Path, config: Config) -> None:
     try:
-        sources = resolve_sources(package, ipfs_backend)
+        sources = resolve_sources(package, config)
     except KeyError:
         return
 
-    for path, source_contents in sources.items():
-        target_file = package_dir / SRC_DIR_NAME / path
-        target_dir = target_file.parent
-        if not target_dir.is_dir():
-            target_dir.mkdir(parents=True)
-        target_file.touch()
-        validate_parent_directory((package_dir / SRC_DIR_NAME), target_file)
-        target_file.write_text(source_contents)
+    src_dir = package_dir / SRC_DIR_NAME
+    target_files = {src_dir / path: contents for path, contents in sources.items()}
+    for target_file in target_files:
+        validate_parent_directory(src_dir, target_file)
+
+    # Sources tend to share parent directories, so only create each one once
+    for target_dir in {target_file.parent for target_file in target_files}:
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+    for target_file, source_contents in target_files.items():
+        write_bytes(target_file, source_contents.encode("utf-8"))
 
 
 @to_dict
-def resolve_sources(
-    package: Package, ipfs_backend: BaseIPFSBackend
-) -> Iterable[Tuple[str, str]]:
-    for path, source_object in package.manifest["sources"].items():
-        # for inlined sources
-        if "content" in source_object:
-            yield path, source_object["content"]
-        else:
-            ipfs_uri = next(
-                (uri for uri in source_object["urls"] if is_ipfs_uri(uri)), None
-            )
-            if not ipfs_uri:
-                raise InstallError("Manifest is missing a content-addressed uri.")
-            contents = to_text(ipfs_backend.fetch_uri_contents(ipfs_uri)).rstrip("\n")
-            yield path, contents
+def resolve_sources(package: Package, config: Config) -> Iterable[Tuple[str, str]]:
+    sources = package.manifest["sources"]
+    # Inlined sources need no network access, so only the ipfs sources are fetched
+    inline_sources = {
+        path: source_object["content"]
+        for path, source_object in sources.items()
+        if "content" in source_object
+    }
+    ipfs_sources = {
+        path: get_ipfs_source_uri(source_object)
+        for path, source_object in sources.items()
+        if "content" not in source_object
+    }
+    yield from inline_sources.items()
+    if not ipfs_sources:
+        return
 
+    # Fetch all ipfs sources concurrently, since each fetch is network-bound
+    fetches = {
+        config.executor.submit(fetch_ipfs_contents, ipfs_uri, config.ipfs_backend): path
+        for path, ipfs_uri in ipfs_sources.items()
+    }
+    for fetch in as_completed(fetches):
+        yield fetches[fetch], to_text(fetch.result()).rstrip("\n")
 
-def write_docs_to_disk(
-    package: Package, package_dir: Path, ipfs_backend: BaseIPFSBackend
-) -> None:
+
+def get_ipfs_source_uri(source_object: Dict[str, Any]) -> URI:
+    ipfs_uri = next((uri for uri in source_object["urls"] if is_ipfs_uri(uri)), None)
+    if not ipfs_uri:
+        raise InstallError("Manifest is missing a content-addressed uri.")
+    return ipfs_uri
+
+
+def write_docs_to_disk(package: Package, package_dir: Path, config: Config) -> None:
     try:
         doc_uri = package.manifest["meta"]["links"]["documentation"]
     except KeyError:
         return
 
     if is_ipfs_uri(doc_uri):
-        documentation = ipfs_backend.fetch_uri_contents(doc_uri)
+        documentation = fetch_ipfs_contents(doc_uri, config.ipfs_backend)
         doc_path = package_dir / "documentation.md"
-        doc_path.touch()
-        doc_path.write_bytes(documentation)
+        write_bytes(doc_path, documentation)
 
 
 def write_build_deps_to_disk(
-    package: Package, package_dir: Path, ipfs_backend: BaseIPFSBackend
-) -> None:
-    if "buildDependencies" in package.manifest:
+    level: Sequence[Tuple[Package, Path]], config: Config
+) -> List[Tuple[Package, Path]]:
+    """
+    Create the installation directories and lockfiles for the build dependencies
+    of every package in a level of the dependency tree, and return the next level.
+    """
+    parents = [
+        (package, package_dir)
+        for package, package_dir in level
+        if "buildDependencies" in package.manifest
+    ]
+    if not parents:
+        return []
+
+    dep_uris = [
+        uri
+        for package, _ in parents
+        for uri in package.manifest["buildDependencies"].values()
+    ]
+    raw_manifests = prefetch_manifests(dep_uris, config.ipfs_backend, config.executor)
+    next_level = []
+    for package, package_dir in parents:
         child_ethpm_dir = package_dir / ETHPM_PACKAGES_DIR
         child_ethpm_dir.mkdir()
+        # Build the dependencies' lockfile in memory, so it's only written once
+        child_ethpm_lock = {}
         for name, uri in package.manifest["buildDependencies"].items():
-            dep_package = Package(Namespace(uri=uri, alias=""), ipfs_backend)
-            tmp_dep_dir = child_ethpm_dir / name
-            tmp_dep_dir.mkdir()
-            validate_parent_directory(package_dir, tmp_dep_dir)
-            write_package_installation_files(dep_package, tmp_dep_dir, ipfs_backend)
+            dep_package = Package(
+                Namespace(uri=uri, alias=""),
+                config.ipfs_backend,
+                raw_manifests.get(uri),
+            )
+            dep_dir = child_ethpm_dir / name
+            dep_dir.mkdir()
+            validate_parent_directory(package_dir, dep_dir)
+            child_ethpm_lock[dep_package.alias] = dep_package.generate_ethpm_lock()
+            next_level.append((dep_package, dep_dir))
+        write_ethpm_lock(child_ethpm_lock, child_ethpm_dir / LOCKFILE_NAME)
+    return next_level
 
 
 def install_to_ethpm_lock(package: Package, ethpm_lock: Path) -> None:
-    if ethpm_lock.is_file():
+    try:
         old_lock = json.loads(ethpm_lock.read_text())
-    else:
+    except FileNotFoundError:
         old_lock = {}
-        ethpm_lock.touch()
     new_package_data = package.generate_ethpm_lock()
     new_lock = assoc(old_lock, package.alias, new_package_data)
-    ethpm_lock.write_text(f"{json.dumps(new_lock, sort_keys=True, indent=4)}\n")
+    write_ethpm_lock(new_lock, ethpm_lock)
+
+
+def write_ethpm_lock(lock: Dict[str, Any], ethpm_lock: Path) -> None:
+    ethpm_lock.write_text(f"{json.dumps(lock, sort_keys=True, indent=4)}\n")
 
 
 def uninstall_from_ethpm_lock(package_name: str, ethpm_lock: Path) -> None:
@@ -6,8 +6,7 @@ from eth_typing import HexStr, Manifest
 from eth_utils import is_checksum_address, to_hex, to_int, to_list, to_tuple
 from ethpm.constants import SUPPORTED_CHAIN_IDS
 from ethpm.tools import builder as b
-from ethpm.uri import create_latest_block_uri, is_ipfs_uri
-from ethpm.validation.manifest import validate_manifest_against_schema
+from ethpm.uri import create_latest_block_uri
 from ethpm.validation.package import validate_package_name
 from web3 import Web3
 
@@ -21,9 +20,10 @@ from ethpm_cli._utils.solc import (
     get_contract_types,
     get_contract_types_and_sources,
 )
+from ethpm_cli._utils.uri import is_ipfs_uri
 from ethpm_cli.config import setup_w3
 from ethpm_cli.constants import SOLC_OUTPUT
-from ethpm_cli.validation import validate_solc_output
+from ethpm_cli.validation import validate_manifest_against_schema, validate_solc_output
 
 
 def generate_basic_manifest(package_name: str, version: str, project_dir: Path) -> None:
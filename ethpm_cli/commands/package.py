@@ -1,40 +1,49 @@
 from argparse import Namespace
 from collections import namedtuple
+from concurrent.futures import Executor
+import functools
 import json
-from typing import Any, Dict, Iterable, NamedTuple, Tuple  # noqa: F401
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Set, Tuple  # noqa: F401
 from urllib import parse
 
 from eth_typing import URI, Address, Manifest  # noqa: F401
-from eth_utils import to_dict, to_text
+from eth_utils import to_dict
 from ethpm._utils.ipfs import extract_ipfs_path_from_uri
 from ethpm.backends.http import GithubOverHTTPSBackend
 from ethpm.backends.ipfs import BaseIPFSBackend
 from ethpm.backends.registry import RegistryURIBackend, parse_registry_uri
-from ethpm.validation.manifest import (
-    validate_manifest_against_schema,
-    validate_manifest_deployments,
-    validate_raw_manifest_format,
-)
+from ethpm.validation.manifest import validate_manifest_deployments
 
+from ethpm_cli._utils.ipfs import fetch_ipfs_contents
+from ethpm_cli._utils.uri import is_ipfs_uri, is_valid_content_addressed_github_uri
 from ethpm_cli.commands.etherscan import EtherscanURIBackend
 from ethpm_cli.exceptions import UriNotSupportedError
+from ethpm_cli.validation import (
+    validate_manifest_against_schema,
+    validate_raw_manifest_format,
+)
 
 
 class Package:
-    def __init__(self, args: Namespace, ipfs_backend: BaseIPFSBackend) -> None:
+    def __init__(
+        self,
+        args: Namespace,
+        ipfs_backend: BaseIPFSBackend,
+        raw_manifest: Optional[bytes] = None,
+    ) -> None:
         self.ipfs_backend = ipfs_backend
         resolved_install_uri = resolve_install_uri(args)
         self.manifest_uri: URI = resolved_install_uri.manifest_uri
         self.registry_address: Address = resolved_install_uri.registry_address
         resolved_manifest_uri = resolve_manifest_uri(
-            self.manifest_uri, self.ipfs_backend
+            self.manifest_uri, self.ipfs_backend, raw_manifest
         )
         self.raw_manifest: bytes = resolved_manifest_uri.raw_manifest
         self.resolved_content_hash: str = resolved_manifest_uri.resolved_content_hash
 
         self.manifest: Manifest = process_and_validate_raw_manifest(self.raw_manifest)
         if "alias" in args and args.alias:
-            self.alias = args.alias
+            self.alias: str = args.alias
         else:
             self.alias = self.manifest["name"]
         self.install_uri = args.uri
@@ -68,22 +77,61 @@ ResolvedManifestURI = namedtuple(
 )
 
 
-def resolve_manifest_uri(uri: URI, ipfs: BaseIPFSBackend) -> ResolvedManifestURI:
+def resolve_manifest_uri(
+    uri: URI, ipfs: BaseIPFSBackend, raw_manifest: Optional[bytes] = None
+) -> ResolvedManifestURI:
+    """
+    Resolve the manifest found at a content-addressed uri. If the raw manifest
+    has already been fetched from the uri, it can be provided to skip the fetch.
+    """
     github_backend = GithubOverHTTPSBackend()
     if github_backend.can_resolve_uri(uri):
-        raw_manifest = github_backend.fetch_uri_contents(uri)
         resolved_content_hash = parse.urlparse(uri).path.split("/")[-1]
     elif ipfs.can_resolve_uri(uri):
-        raw_manifest = ipfs.fetch_uri_contents(uri)
         resolved_content_hash = extract_ipfs_path_from_uri(uri)
     else:
         raise UriNotSupportedError(
             f"{uri} is not supported. Currently ethPM CLI only supports "
             "IPFS and Github blob manifest uris."
         )
+
+    if raw_manifest is None:
+        raw_manifest = fetch_raw_manifest(uri, ipfs)
     return ResolvedManifestURI(raw_manifest, resolved_content_hash)
 
 
+def fetch_raw_manifest(uri: URI, ipfs: BaseIPFSBackend) -> bytes:
+    if is_valid_content_addressed_github_uri(uri):
+        return _fetch_github_contents(uri)
+    return fetch_ipfs_contents(uri, ipfs)
+
+
+# Github blob uris are content-addressed, so the contents found at a uri never
+# change and can be safely cached for the lifetime of the process.
+@functools.lru_cache(maxsize=256)
+def _fetch_github_contents(uri: URI) -> bytes:
+    return GithubOverHTTPSBackend().fetch_uri_contents(uri)
+
+
+def prefetch_manifests(
+    uris: Iterable[URI], ipfs_backend: BaseIPFSBackend, executor: Executor
+) -> Dict[URI, bytes]:
+    """
+    Concurrently fetch the raw manifests found at all of the given content-addressed
+    uris. Other uris (e.g. registry uris) are skipped, since they must be resolved
+    to a manifest uri before their manifest can be fetched.
+    """
+    unique_uris = tuple(
+        uri
+        for uri in set(uris)
+        if is_ipfs_uri(uri) or is_valid_content_addressed_github_uri(uri)
+    )
+    raw_manifests = executor.map(
+        fetch_raw_manifest, unique_uris, (ipfs_backend,) * len(unique_uris)
+    )
+    return dict(zip(unique_uris, raw_manifests))
+
+
 def resolve_install_uri(args: Namespace) -> ResolvedInstallURI:
     registry_backend = RegistryURIBackend()
     etherscan_backend = EtherscanURIBackend()
@@ -101,10 +149,24 @@ def resolve_install_uri(args: Namespace) -> ResolvedInstallURI:
     return ResolvedInstallURI(manifest_uri, registry_address)
 
 
+# Schema validation is expensive, so only validate each unique manifest once. Only
+# the validation is skipped, so every Package still gets its own manifest dict.
+_VALIDATED_RAW_MANIFESTS: Set[bytes] = set()
+
+
 def process_and_validate_raw_manifest(raw_manifest: bytes) -> Manifest:
-    raw_manifest_text = to_text(raw_manifest).rstrip("\n")
-    validate_raw_manifest_format(raw_manifest_text)
-    manifest = json.loads(raw_manifest_text)
-    validate_manifest_against_schema(manifest)
-    validate_manifest_deployments(manifest)
+    raw_manifest_text = raw_manifest.rstrip(b"\n").decode("utf-8")
+    try:
+        manifest = json.loads(raw_manifest_text)
+    except json.JSONDecodeError as err:
+        raise json.JSONDecodeError(
+            "Failed to load package data. File is not a valid JSON document.",
+            err.doc,
+            err.pos,
+        )
+    if raw_manifest not in _VALIDATED_RAW_MANIFESTS:
+        validate_raw_manifest_format(raw_manifest_text, manifest)
+        validate_manifest_against_schema(manifest)
+        validate_manifest_deployments(manifest)
+        _VALIDATED_RAW_MANIFESTS.add(raw_manifest)
     return manifest
@@ -5,13 +5,14 @@ from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
 from eth_typing import URI
 from eth_utils import to_int, to_tuple
 from eth_utils.toolz import assoc, assoc_in, dissoc
-from ethpm.backends.registry import is_valid_registry_uri, parse_registry_uri
+from ethpm.backends.registry import parse_registry_uri
 from ethpm.constants import SUPPORTED_CHAIN_IDS
 from web3 import Web3
 
 from ethpm_cli._utils.filesystem import atomic_replace
 from ethpm_cli._utils.logger import cli_logger
 from ethpm_cli._utils.shellart import bold_blue, bold_green, bold_white
+from ethpm_cli._utils.uri import is_valid_registry_uri
 from ethpm_cli.config import Config, setup_w3
 from ethpm_cli.constants import REGISTRY_STORE
 from ethpm_cli.exceptions import AmbigiousFileSystem, AuthorizationError, InstallError
@@ -8,10 +8,11 @@ from typing import Any, Dict, Iterable, List, Set, Tuple  # noqa: F401
 from eth_typing import URI, Address, BlockNumber
 from eth_utils import to_dict, to_list
 from eth_utils.toolz import assoc
-from ethpm._utils.ipfs import extract_ipfs_path_from_uri, is_ipfs_uri
+from ethpm._utils.ipfs import extract_ipfs_path_from_uri
 from ethpm.uri import is_supported_content_addressed_uri, resolve_uri_contents
 from web3 import Web3
 
+from ethpm_cli._utils.uri import is_ipfs_uri
 from ethpm_cli._utils.various import flatten
 from ethpm_cli.config import write_updated_chain_data
 from ethpm_cli.constants import VERSION_RELEASE_ABI
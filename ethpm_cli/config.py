@@ -1,8 +1,11 @@
 from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor
+import copy
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict
+from types import TracebackType
+from typing import Any, Dict, Optional, Type
 
 from eth_account import Account
 from eth_utils import to_checksum_address
@@ -13,7 +16,7 @@ from web3.middleware import construct_sign_and_send_raw_middleware
 from web3.providers.auto import load_provider_from_uri
 
 from ethpm_cli._utils.filesystem import atomic_replace
-from ethpm_cli._utils.ipfs import get_ipfs_backend
+from ethpm_cli._utils.ipfs import get_ipfs_backend, get_ipfs_fetch_workers
 from ethpm_cli._utils.logger import cli_logger
 from ethpm_cli._utils.xdg import get_xdg_ethpmcli_root
 from ethpm_cli.commands.auth import get_authorized_private_key, import_keyfile
@@ -35,9 +38,14 @@ class Config:
     - Validate / Initialize ethpm packages dir
     - Setup w3
     - Projects dir
+    - Thread pool for concurrent IPFS fetches
+
+    Can be used as a context manager to shut down the thread pool on exit.
     """
 
     private_key = None
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_owner: Optional["Config"] = None
 
     def __init__(self, args: Namespace) -> None:
         # Setup IPFS backend
@@ -49,13 +57,15 @@ class Config:
         # Setup _ethpm_packages dir
         if "ethpm_dir" in args and args.ethpm_dir:
             self.ethpm_dir = args.ethpm_dir
+            validate_ethpm_dir(self.ethpm_dir)
         elif ETHPM_DIR_ENV_VAR in os.environ:
             self.ethpm_dir = Path(os.environ[ETHPM_DIR_ENV_VAR])
+            validate_ethpm_dir(self.ethpm_dir)
         else:
-            self.ethpm_dir = Path.cwd() / ETHPM_PACKAGES_DIR
+            # The default dir is always valid, so it doesn't need to be re-validated
+            self.ethpm_dir = Path(os.getcwd(), ETHPM_PACKAGES_DIR)
             if not self.ethpm_dir.is_dir():
                 self.ethpm_dir.mkdir()
-        validate_ethpm_dir(self.ethpm_dir)
 
         # Setup w3
         if "chain_id" in args and args.chain_id:
@@ -90,6 +100,38 @@ class Config:
         else:
             self.manifest_path = None
 
+    def __enter__(self) -> "Config":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor_owner is not None:
+            return self._executor_owner.executor
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(get_ipfs_fetch_workers())
+        return self._executor
+
+    def copy_with_ethpm_dir(self, ethpm_dir: Path) -> "Config":
+        """
+        Return a copy of this config that uses a different ethpm dir. The copy uses
+        this config's thread pool, so the pool is shut down along with this config.
+        """
+        config_copy = copy.copy(self)
+        config_copy.ethpm_dir = ethpm_dir
+        config_copy._executor = None
+        config_copy._executor_owner = self._executor_owner or self
+        return config_copy
+
 
 def setup_w3(chain_id: int, private_key: str = None) -> Web3:
     if chain_id not in SUPPORTED_CHAIN_IDS.keys():
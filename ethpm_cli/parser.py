@@ -492,9 +492,9 @@ scrape_parser.set_defaults(func=scrape_action)
 
 def install_action(args: argparse.Namespace) -> None:
     validate_install_cli_args(args)
-    config = Config(args)
-    package = Package(args, config.ipfs_backend)
-    install_package(package, config)
+    with Config(args) as config:
+        package = Package(args, config.ipfs_backend)
+        install_package(package, config)
     cli_logger.info(
         "%s package sourced from %s installed to %s.",
         package.alias,
@@ -533,8 +533,8 @@ install_parser.set_defaults(func=install_action)
 
 
 def update_action(args: argparse.Namespace) -> None:
-    config = Config(args)
-    update_package(args, config)
+    with Config(args) as config:
+        update_package(args, config)
 
 
 update_parser = ethpm_parser.add_parser(
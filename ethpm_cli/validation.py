@@ -1,17 +1,28 @@
 from argparse import Namespace
+import functools
 import json
 import os
 from pathlib import Path
+import re
+from typing import Any, Callable, Dict
 
 from eth_typing import URI
 from eth_utils import is_same_address
-from ethpm.backends.registry import is_valid_registry_uri, parse_registry_uri
+from ethpm import get_ethpm_spec_dir
+from ethpm.backends.registry import parse_registry_uri
 from ethpm.exceptions import EthPMValidationError
-from ethpm.uri import is_ipfs_uri, is_valid_content_addressed_github_uri
 from ethpm.validation.package import validate_package_name
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from web3 import Web3
 
 from ethpm_cli._utils.etherscan import is_etherscan_uri
+from ethpm_cli._utils.uri import (
+    is_ipfs_uri,
+    is_valid_content_addressed_github_uri,
+    is_valid_registry_uri,
+)
 from ethpm_cli.constants import ETHERSCAN_KEY_ENV_VAR, SOLC_OUTPUT
 from ethpm_cli.exceptions import (
     EtherscanKeyNotFound,
@@ -22,7 +33,9 @@ from ethpm_cli.exceptions import (
 
 
 def validate_parent_directory(parent_dir: Path, child_dir: Path) -> None:
-    if parent_dir not in child_dir.parents:
+    # Normalizing collapses any ".." segments, so a plain prefix check is enough
+    parent_prefix = os.path.join(os.path.normpath(parent_dir), "")
+    if not os.path.normpath(child_dir).startswith(parent_prefix):
         raise InstallError(f"{parent_dir} was not found in {child_dir} directory tree.")
 
 
@@ -98,13 +111,28 @@ def validate_etherscan_key_available() -> None:
         )
 
 
+# Each supported uri scheme is handled by exactly one uri validator, so matching
+# the scheme first means only that validator has to run.
+SUPPORTED_URI_SCHEME_PATTERN = re.compile(
+    r"(ipfs|etherscan|erc1319|ethpm|https):", re.IGNORECASE
+)
+SUPPORTED_URI_VALIDATORS: Dict[str, Callable[[URI], bool]] = {
+    "ipfs": is_ipfs_uri,
+    "etherscan": is_etherscan_uri,
+    "erc1319": is_valid_registry_uri,
+    "ethpm": is_valid_registry_uri,
+    "https": is_valid_content_addressed_github_uri,
+}
+
+
 def validate_supported_uri(uri: URI) -> None:
-    if (
-        not is_ipfs_uri(uri)
-        and not is_etherscan_uri(uri)  # noqa: W503
-        and not is_valid_registry_uri(uri)  # noqa: W503
-        and not is_valid_content_addressed_github_uri(uri)  # noqa: W503
-    ):
+    scheme_match = SUPPORTED_URI_SCHEME_PATTERN.match(uri)
+    if not scheme_match:
+        is_supported_uri = False
+    else:
+        is_supported_uri = SUPPORTED_URI_VALIDATORS[scheme_match.group(1).lower()](uri)
+
+    if not is_supported_uri:
         raise UriNotSupportedError(
             f"Target uri: {uri} not a currently supported uri. "
             "Target uris must be one of: ipfs, github blob, etherscan, or registry."
@@ -156,3 +184,41 @@ def validate_same_registry(left: str, right: str) -> None:
         raise ValidationError(
             f"Registry URI: {left} does not match the registry found on URI: {right}."
         )
+
+
+@functools.lru_cache(maxsize=None)
+def get_manifest_schema_validator() -> Draft7Validator:
+    v3_schema_path = get_ethpm_spec_dir() / "spec" / "v3.spec.json"
+    schema_data = json.loads(v3_schema_path.read_text())
+    return validator_for(schema_data, Draft7Validator)(schema_data)
+
+
+def validate_manifest_against_schema(manifest: Dict[str, Any]) -> None:
+    """
+    Validates a manifest against the v3 manifest schema. Equivalent to the ethpm
+    validator of the same name, but the schema is only loaded and compiled once.
+    """
+    validator = get_manifest_schema_validator()
+    # Report the same error as jsonschema.validate, which ethpm's validator uses
+    e = best_match(validator.iter_errors(manifest))
+    if e is not None:
+        raise EthPMValidationError(
+            f"Manifest invalid for schema version {validator.schema['version']}. "
+            f"Reason: {e.message}"
+            f"{e}"
+        )
+
+
+def validate_raw_manifest_format(raw_manifest: str, manifest: Dict[str, Any]) -> None:
+    """
+    Validates that a raw manifest is tightly packed with alphabetically sorted keys.
+    Equivalent to the ethpm validator of the same name, but reuses the already
+    decoded manifest rather than decoding the raw manifest a second time.
+    """
+    compact_manifest = json.dumps(manifest, sort_keys=True, separators=(",", ":"))
+    if raw_manifest != compact_manifest:
+        raise EthPMValidationError(
+            "The manifest appears to be malformed. Please ensure that it conforms to the "
+            "EthPM-Spec for document format. "
+            "http://ethpm.github.io/ethpm-spec/package-spec.html#document-format "
+        )
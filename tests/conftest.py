@@ -36,7 +36,8 @@ def config(tmpdir, monkeypatch):
     namespace.install_uri = None
     namespace.alias = None
     namespace.ethpm_dir = ethpm_dir
-    return Config(namespace)
+    with Config(namespace) as config:
+        yield config
 
 
 @pytest.fixture
@@ -1,6 +1,9 @@
+import os
+import stat
+
 import pytest
 
-from ethpm_cli._utils.filesystem import atomic_replace
+from ethpm_cli._utils.filesystem import atomic_replace, write_bytes
 
 
 @pytest.fixture
@@ -28,3 +31,27 @@ def test_atomic_replace_is_atomic(original):
 
     assert "original" in original.read_text()
     assert "update" not in original.read_text()
+
+
+@pytest.mark.parametrize("contents", (b"", b"update", "\u2603\n".encode("utf-8")))
+def test_write_bytes_overwrites_file(original, contents):
+    write_bytes(original, contents)
+
+    assert original.read_bytes() == contents
+
+
+def test_write_bytes_creates_file(tmp_path):
+    new_file = tmp_path / "new.txt"
+    write_bytes(new_file, b"new")
+
+    assert new_file.read_bytes() == b"new"
+
+
+def test_write_bytes_respects_umask(tmp_path):
+    old_umask = os.umask(0o002)
+    try:
+        write_bytes(tmp_path / "new.txt", b"new")
+    finally:
+        os.umask(old_umask)
+
+    assert stat.S_IMODE((tmp_path / "new.txt").stat().st_mode) == 0o664
@@ -80,3 +80,29 @@ def test_config_initializes_xdg_dir(config):
     xdg_ethpm_dir = get_xdg_ethpmcli_root()
     assert (xdg_ethpm_dir / KEYFILE_PATH).is_file()
     assert (xdg_ethpm_dir / IPFS_CHAIN_DATA).is_file()
+
+
+def test_config_shuts_down_executor_on_exit(namespace):
+    namespace.ethpm_dir = None
+    with Config(namespace) as config:
+        executor = config.executor
+        assert config.executor is executor
+
+    assert config._executor is None
+    assert executor._shutdown is True
+
+
+def test_config_copy_with_ethpm_dir_shares_executor(tmpdir, namespace):
+    namespace.ethpm_dir = None
+    copy_ethpm_dir = Path(tmpdir) / "copy" / ETHPM_PACKAGES_DIR
+    with Config(namespace) as config:
+        config_copy = config.copy_with_ethpm_dir(copy_ethpm_dir)
+        assert config._executor is None
+        assert config_copy.ethpm_dir == copy_ethpm_dir
+        assert config_copy.ethpm_dir != config.ethpm_dir
+
+        executor = config_copy.executor
+        assert config.executor is executor
+
+    assert config._executor is None
+    assert executor._shutdown is True
@@ -1,12 +1,13 @@
 from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 from ethpm_cli._utils.ipfs import get_ipfs_backend
-from ethpm_cli.commands.package import Package
+from ethpm_cli.commands.package import Package, prefetch_manifests
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ipfs_backend():
     return get_ipfs_backend()
 
@@ -61,3 +62,13 @@ def test_package_with_registry_uri_with_alias(owned_pkg_data, ipfs_backend):
     assert package.resolved_content_hash == owned_pkg_data["content_hash"]
     assert package.raw_manifest == owned_pkg_data["raw_manifest"]
     assert package.manifest == owned_pkg_data["manifest"]
+
+
+def test_prefetch_manifests_skips_uris_that_need_resolving(
+    owned_pkg_data, ipfs_backend
+):
+    uris = (owned_pkg_data["ipfs_uri"], owned_pkg_data["registry_uri"])
+    with ThreadPoolExecutor() as executor:
+        raw_manifests = prefetch_manifests(uris, ipfs_backend, executor)
+
+    assert raw_manifests == {owned_pkg_data["ipfs_uri"]: owned_pkg_data["raw_manifest"]}
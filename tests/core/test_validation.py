@@ -1,11 +1,24 @@
 from argparse import Namespace
 from pathlib import Path
 
+from ethpm.exceptions import EthPMValidationError
 import pytest
 
 from ethpm_cli.constants import ETHPM_PACKAGES_DIR
 from ethpm_cli.exceptions import InstallError, UriNotSupportedError, ValidationError
-from ethpm_cli.validation import validate_install_cli_args, validate_same_registry
+from ethpm_cli.validation import (
+    validate_install_cli_args,
+    validate_manifest_against_schema,
+    validate_parent_directory,
+    validate_same_registry,
+)
+
+MULTIPLE_ERRORS_MANIFEST = {
+    "manifest": "ethpm/3",
+    "name": "owned",
+    "version": "1.0.0",
+    "contractTypes": {"Owned": {"abi": 1, "deploymentBytecode": {"bytecode": 3}}},
+}
 
 
 @pytest.fixture
@@ -130,3 +143,47 @@ def test_validate_same_registry_validates_matching_registries(left, right):
 def test_validate_same_registry_invalidates_nonmatching_registries(left, right):
     with pytest.raises(ValidationError):
         validate_same_registry(left, right)
+
+
+def test_validate_manifest_against_schema_validates_valid_manifests(owned_pkg_data):
+    assert validate_manifest_against_schema(owned_pkg_data["manifest"]) is None
+
+
+@pytest.mark.parametrize(
+    "manifest",
+    (
+        {},
+        {"manifest": "ethpm/3", "name": 1, "version": "1.0.0"},
+        {"manifest": "ethpm/2", "name": "owned", "version": "1.0.0"},
+        {"manifest": "ethpm/3", "sources": []},
+        MULTIPLE_ERRORS_MANIFEST,
+    ),
+)
+def test_validate_manifest_against_schema_rejects_invalid_manifests(manifest):
+    with pytest.raises(EthPMValidationError, match="Manifest invalid"):
+        validate_manifest_against_schema(manifest)
+
+
+def test_validate_manifest_against_schema_reports_best_matching_error():
+    with pytest.raises(EthPMValidationError, match="Reason: 1 is not of type 'array'"):
+        validate_manifest_against_schema(MULTIPLE_ERRORS_MANIFEST)
+
+
+@pytest.mark.parametrize(
+    "child_dir", ("owned", "owned/_src/Owned.sol", "owned/../wallet", "./owned/_src"),
+)
+def test_validate_parent_directory_validates_child_dirs(child_dir, tmpdir):
+    parent_dir = Path(tmpdir) / ETHPM_PACKAGES_DIR
+
+    assert validate_parent_directory(parent_dir, parent_dir / child_dir) is None
+
+
+@pytest.mark.parametrize(
+    "child_dir",
+    ("", ".", "..", "../owned", "owned/../../owned", "/owned", "../_ethpm_packages_x"),
+)
+def test_validate_parent_directory_rejects_non_child_dirs(child_dir, tmpdir):
+    parent_dir = Path(tmpdir) / ETHPM_PACKAGES_DIR
+
+    with pytest.raises(InstallError):
+        validate_parent_directory(parent_dir, parent_dir / child_dir)